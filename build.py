@@ -7,6 +7,11 @@ Inputs (mutually exclusive):
   --smiles "CCC([Br]CC#C)=C"                 # SMILES string
   --inchi "InChI=1S/..."                     # InChI string
   --formula "C8H12Br"                        # Formula-only mode (no unique 3D)
+  --names-file names.txt                     # Batch: one IUPAC name per line (single OPSIN run)
+  --batch inputs.txt                         # Batch: 'name:'/'smiles:'/'inchi:' lines, built in parallel
+
+Options:
+  --hq                                       # Slower 3D: lowest-energy of several MMFF-minimized conformers
 
 Outputs (in out/<TITLE>/):
   - index.html            # Interactive 3D viewer page (3Dmol.js)
@@ -22,17 +27,47 @@ Dependencies:
   - Python: rdkit-pypi, jinja2
 """
 
-import os, argparse, subprocess
+import os, sys, re, json, hashlib, argparse, subprocess, atexit, functools, multiprocessing
 from pathlib import Path
-from jinja2 import Template
+from concurrent.futures import ThreadPoolExecutor
+from jinja2 import Environment, FileSystemLoader
 from rdkit import Chem
-from rdkit.Chem import AllChem, Draw, rdMolDescriptors
+# AllChem / rdMolDescriptors / rdMolDraw2D are imported inside the functions
+# that need them, so --formula mode and --help skip loading them.
 
 # --- Paths relative to this script ---
 HERE = Path(__file__).parent
 TPL_HTML = HERE / "templates" / "page.html.j2"       # HTML template for the tutorial page
 TPL_YT   = HERE / "templates" / "youtube_desc.md.j2" # Template for YouTube description
 OPSIN    = HERE / "opsin.jar"                        # OPSIN jar for name->SMILES
+OPSIN_CACHE = HERE / ".opsin_cache.json"             # On-disk name->SMILES cache
+
+# JVM flags for OPSIN: C1-only JIT and class-data sharing cut startup time (Java 17+)
+JAVA_OPTS = ["-XX:TieredStopAtLevel=1", "-Xshare:auto"]
+
+@functools.cache
+def _jinja_env() -> Environment:
+    """
+    Shared Jinja2 environment; parsed templates are kept in its cache and,
+    with auto_reload off, never re-stat'ed or re-compiled.
+    """
+    return Environment(loader=FileSystemLoader(str(TPL_HTML.parent)), auto_reload=False)
+
+def _get_html_tpl():
+    """Parsed HTML page template (loaded on first use)."""
+    return _jinja_env().get_template(TPL_HTML.name)
+
+def _get_yt_tpl():
+    """Parsed YouTube description template (loaded on first use)."""
+    return _jinja_env().get_template(TPL_YT.name)
+
+def slugify(text: str) -> str:
+    """
+    Turn a molecule title into a filesystem-safe folder name.
+    Example: "4-bromo-3-methylhept-1-en-6-yne" -> "4-bromo-3-methylhept-1-en-6-yne"
+    """
+    slug = re.sub(r"[^A-Za-z0-9._-]+", "-", text.strip()).strip("-.")
+    return slug[:120] or "molecule"
 
 def ensure_out(dirpath: Path) -> Path:
     """
@@ -42,43 +77,169 @@ def ensure_out(dirpath: Path) -> Path:
     dirpath.mkdir(parents=True, exist_ok=True)
     return dirpath
 
-def name_to_smiles(name: str) -> str:
+class OpsinWorker:
     """
-    OPSIN 2.8.0 CLI expects files:
-      java -jar opsin.jar -osmi input.txt output.txt
-    This writes the name to a temp input file and reads SMILES from a temp output file.
+    Long-lived OPSIN process that converts names to SMILES over stdin/stdout.
+    With no file arguments OPSIN reads one name per line from stdin and writes
+    one SMILES per line to stdout, so the JVM is started once and its
+    NameToStructure instance is reused for every name.
     """
-    import tempfile, os, subprocess, pathlib
 
-    in_fd, in_path = tempfile.mkstemp(prefix="opsin_in_", text=True)
-    out_fd, out_path = tempfile.mkstemp(prefix="opsin_out_", text=True)
-    os.close(in_fd); os.close(out_fd)
+    def __init__(self, jar: Path = OPSIN):
+        cmd = ["java", *JAVA_OPTS, "-jar", str(jar), "-osmi"]
+        self.proc = subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,           # stdin-mode banner + parse errors; failures raise below
+            text=True,
+            encoding="utf-8",
+            bufsize=1,                           # line-buffered: one name in, one SMILES out
+        )
 
-    try:
-        pathlib.Path(in_path).write_text(name.strip() + "\n", encoding="utf-8")
-        cmd = ["java", "-jar", str(OPSIN), "-osmi", in_path, out_path]
-        # (Optional) add '-v' here to get verbose parsing diagnostics:
-        # cmd = ["java","-jar",str(OPSIN),"-v","-osmi",in_path,out_path]
-        subprocess.check_call(cmd)
-
-        out = pathlib.Path(out_path).read_text(encoding="utf-8").strip()
-        # OPSIN writes one SMILES per line (may be tab-delimited if name flag enabled)
-        smi = out.splitlines()[0].split()[0]
+    def to_smiles(self, name: str) -> str:
+        """
+        Send one name to OPSIN and read back its SMILES.
+        OPSIN writes an empty line for names it cannot parse.
+        """
+        if self.proc.poll() is not None:
+            raise RuntimeError(f"OPSIN worker exited with code {self.proc.returncode}")
+        # a newline inside the name would desynchronise the request/response lines
+        self.proc.stdin.write(" ".join(name.split()) + "\n")
+        self.proc.stdin.flush()
+        line = self.proc.stdout.readline()
+        if not line:
+            raise RuntimeError("OPSIN worker closed its output")
+        smi = line.strip().split()[0] if line.strip() else ""
         if not smi:
-            raise RuntimeError("OPSIN returned empty SMILES")
+            raise RuntimeError(f"OPSIN could not parse name: {name!r}")
         return smi
-    finally:
-        for p in (in_path, out_path):
-            try: os.unlink(p)
-            except OSError: pass
 
+    def close(self):
+        """
+        Close stdin so OPSIN exits cleanly, then reap the process.
+        """
+        if self.proc.poll() is None:
+            try:
+                self.proc.stdin.close()
+                self.proc.wait(timeout=5)
+            except (OSError, subprocess.TimeoutExpired):
+                self.proc.kill()
 
+_opsin_worker = None
+
+def _get_opsin_worker() -> OpsinWorker:
+    """
+    Lazily start the shared OPSIN worker on first use (shut down at exit).
+    """
+    global _opsin_worker
+    if _opsin_worker is None:
+        _opsin_worker = OpsinWorker()
+        atexit.register(_opsin_worker.close)
+    return _opsin_worker
 
+_opsin_cache = None
+
+def _opsin_cache_key(name: str) -> str:
+    """
+    Cache key for a name: SHA-1 of the whitespace-normalized name.
+    """
+    return hashlib.sha1(" ".join(name.split()).encode("utf-8")).hexdigest()
+
+def _read_opsin_cache_file() -> dict:
+    """
+    Read the on-disk name->SMILES cache (empty if missing/corrupt).
+    """
+    try:
+        data = json.loads(OPSIN_CACHE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+def _load_opsin_cache() -> dict:
+    """
+    Load the on-disk name->SMILES cache once per process.
+    """
+    global _opsin_cache
+    if _opsin_cache is None:
+        _opsin_cache = _read_opsin_cache_file()
+    return _opsin_cache
+
+def _save_opsin_cache(new: dict):
+    """
+    Add entries to the cache and write it atomically (temp file + os.replace).
+    The file is re-read and merged just before writing, so entries added by
+    other processes (e.g. --batch pool workers) since our load are kept.
+    Best effort: a read-only checkout just means no persistence.
+    """
+    cache = _load_opsin_cache()
+    cache.update(_read_opsin_cache_file())
+    cache.update(new)
+    tmp = OPSIN_CACHE.with_name(f"{OPSIN_CACHE.name}.{os.getpid()}.tmp")
+    try:
+        tmp.write_text(json.dumps(cache), encoding="utf-8")
+        os.replace(tmp, OPSIN_CACHE)
+    except OSError:
+        try: tmp.unlink()
+        except OSError: pass
+
+def name_to_smiles(name: str) -> str:
+    """
+    Convert an IUPAC name to SMILES.
+    Checks the on-disk cache first; on a miss uses the shared OPSIN worker,
+    so only the first lookup pays for JVM startup.
+    """
+    key = _opsin_cache_key(name)
+    smi = _load_opsin_cache().get(key)
+    if smi is None:
+        smi = _get_opsin_worker().to_smiles(name.strip())
+        _save_opsin_cache({key: smi})
+    return smi
+
+def names_to_smiles(names: list[str]) -> list[str | None]:
+    """
+    Convert many IUPAC names to SMILES, preserving order.
+    Names found in the on-disk cache are not sent to OPSIN; the rest are
+    converted together in one OPSIN run.
+    Names OPSIN cannot parse come back as None (and are not cached), so one
+    bad name does not sink the whole batch.
+    """
+    cache = _load_opsin_cache()
+    missing = list(dict.fromkeys(n for n in names if _opsin_cache_key(n) not in cache))
+    if missing:
+        found = _run_opsin_batch(missing)
+        _save_opsin_cache({_opsin_cache_key(n): smi
+                           for n, smi in zip(missing, found) if smi is not None})
+    return [cache.get(_opsin_cache_key(n)) for n in names]
+
+def _run_opsin_batch(names: list[str]) -> list[str | None]:
+    """
+    Convert many IUPAC names to SMILES with a single OPSIN run.
+    With no file arguments OPSIN reads names from stdin (one per line) and
+    writes SMILES to stdout in the same order, so no temp files are needed.
+    Returns None for each name OPSIN could not parse.
+    """
+    cmd = ["java", *JAVA_OPTS, "-jar", str(OPSIN), "-osmi"]
+    # (Optional) add '-v' here to get verbose parsing diagnostics
+    p = subprocess.run(
+        cmd,
+        input="\n".join(" ".join(n.split()) for n in names) + "\n",
+        text=True, encoding="utf-8", capture_output=True, check=True,
+    )
+
+    # OPSIN writes one line per input name; unparseable names give an empty line
+    lines = p.stdout.splitlines()
+    smiles = []
+    for i in range(len(names)):
+        smi = lines[i].strip().split()[0] if i < len(lines) and lines[i].strip() else ""
+        smiles.append(smi or None)
+    return smiles
 
 def mol_from_any(name=None, smiles=None, inchi=None):
     """
-    Create an RDKit Mol object (with explicit Hs) from any accepted input.
-    Returns: (Mol_with_Hs, smiles_string)
+    Create RDKit Mol objects from any accepted input: one with explicit Hs
+    (for 3D embedding) and the H-free parse it was built from (for 2D drawing).
+    Returns: (Mol_with_Hs, Mol_without_Hs, smiles_string)
     """
     if name:
         smiles = name_to_smiles(name)            # name -> SMILES via OPSIN
@@ -88,8 +249,9 @@ def mol_from_any(name=None, smiles=None, inchi=None):
         mol = Chem.MolFromSmiles(smiles)         # SMILES -> Mol
     if mol is None:
         raise ValueError("Could not parse structure from input.")
-    mol = Chem.AddHs(mol)                        # add explicit hydrogens for 3D embedding
-    return mol, (smiles if smiles else Chem.MolToSmiles(mol))
+    smiles = smiles or Chem.MolToSmiles(mol)     # canonicalize the small, H-free graph
+    mol_h = Chem.AddHs(mol)                      # add explicit hydrogens for 3D embedding
+    return mol_h, mol, smiles
 
 def formula_du(nC, nH, nN=0, nX=0):
     """
@@ -107,59 +269,121 @@ def compute_facts(mol):
     """
     Compute formula, exact mass, and DU from an RDKit Mol.
     - Uses RDKit to compute the chemical formula and exact mass.
-    - Parses element counts for DU computation.
+    - Counts elements over the atoms for DU computation.
     Returns: (formula_str, exact_mass_float, du_float)
     """
+    from rdkit.Chem import rdMolDescriptors
+
     formula = rdMolDescriptors.CalcMolFormula(mol)
     mw = round(rdMolDescriptors.CalcExactMolWt(mol), 4)
 
-    # Parse element counts from formula for DU calculation.
-    # Note: CalcMolFormula returns e.g. 'C8H12Br' (compact form).
-    import re
-    counts = dict(re.findall(r'([A-Z][a-z]?)(\d*)', formula))
-
-    def get(sym):
-        """
-        Extract integer count for an element symbol.
-        Empty count means '1'.
-        """
-        v = counts.get(sym)
-        if v is None:
-            return 0
-        return int(v) if v != "" else 1
-
-    nC  = get('C')
-    nH  = get('H')
-    nN  = get('N')
-    nF  = get('F')
-    nCl = get('Cl')
-    nBr = get('Br')
-    nI  = get('I')
+    # Element counts for DU straight from the atoms (the formula string is
+    # only for display). Hydrogens may be implicit or explicit atoms.
+    counts = {}
+    nH = 0
+    for a in mol.GetAtoms():
+        sym = a.GetSymbol()
+        counts[sym] = counts.get(sym, 0) + 1
+        if sym != 'H':
+            nH += a.GetTotalNumHs()
+    counts['H'] = counts.get('H', 0) + nH
+
+    nC  = counts.get('C', 0)
+    nH  = counts.get('H', 0)
+    nN  = counts.get('N', 0)
+    nF  = counts.get('F', 0)
+    nCl = counts.get('Cl', 0)
+    nBr = counts.get('Br', 0)
+    nI  = counts.get('I', 0)
 
     du = formula_du(nC, nH, nN, nF + nCl + nBr + nI)
     return formula, mw, du
 
-def make_artifacts(mol, outdir: Path):
+def embed_fast(mol, timeout: int = 10, fallback_attempts: int = 5) -> int:
     """
-    Generate 3D SDF (with ETKDG embedding + UFF minimization) and
-    a 2D PNG (kekulized).
-    Returns: SDF block (string)
+    Embed one 3D conformer with a bounded number of attempts.
+    Tries, in order, until one succeeds:
+      1. ETDG with a single attempt (cheaper than ETKDGv3: no torsion preferences)
+      2. ETDG starting from random coordinates (rescues hard cases)
+      3. ETKDGv3 with small-ring torsions, at most `fallback_attempts` attempts
+    The wall-clock `timeout` (seconds, per stage) only applies on RDKit
+    versions whose EmbedParameters have it (not the pinned 2022.9.5).
+    Returns: conformer id
     """
+    from rdkit.Chem import AllChem
+
+    params = AllChem.ETDG()
+    params.randomSeed = 42                            # reproducible geometry
+    params.maxIterations = 1                          # fail fast instead of retrying
+    if hasattr(params, "timeout"):                    # newer RDKit only (seconds)
+        params.timeout = timeout
+    params.useRandomCoords = False
+    conf_id = AllChem.EmbedMolecule(mol, params)
+    if conf_id < 0:
+        params.useRandomCoords = True
+        conf_id = AllChem.EmbedMolecule(mol, params)
+    if conf_id < 0:
+        params = AllChem.ETKDGv3()
+        params.randomSeed = 42
+        params.useSmallRingTorsions = True
+        params.maxIterations = fallback_attempts      # default is 10x atom count
+        if hasattr(params, "timeout"):
+            params.timeout = timeout
+        conf_id = AllChem.EmbedMolecule(mol, params)
+    if conf_id < 0:
+        raise ValueError("Could not embed a 3D conformer for this structure.")
+    return conf_id
+
+def make_artifacts(mol, mol_no_h, hq: bool = False, num_confs: int = 8, num_threads: int = 0):
+    """
+    Generate the 3D SDF block and a 2D-depiction molecule (no file I/O;
+    writing is left to the caller so it can overlap with other outputs).
+    - Default: a single fast embedding (see embed_fast), no force-field
+      minimization (the geometry is already good enough for the viewer).
+    - hq=True: lowest-energy of several ETKDGv3 conformers after
+      MMFF minimization, on `num_threads` threads (0 = all cores; use 1
+      inside a process pool to avoid oversubscription).
+    Returns: (SDF block string, Mol with 2D coords and no Hs)
+    """
+    from rdkit.Chem import AllChem
+
     # --- 3D conformer generation ---
-    AllChem.EmbedMolecule(mol, AllChem.ETKDG())       # geometry guess
-    AllChem.UFFOptimizeMolecule(mol, maxIters=200)    # quick energy minimization
-    sdf = Chem.MolToMolBlock(mol)                     # SDF text block
-    (outdir / "model.sdf").write_text(sdf)
+    if hq:
+        params = AllChem.ETKDGv3()
+        params.numThreads = num_threads               # 0 = use all cores
+        params.randomSeed = 0xC0FFEE                  # reproducible geometry
+        cids = list(AllChem.EmbedMultipleConfs(mol, numConfs=num_confs, params=params))
+        if not cids:
+            raise ValueError("Could not embed a 3D conformer for this structure.")
+
+        # batch minimization; each result is (not_converged, energy)
+        if AllChem.MMFFHasAllMoleculeParams(mol):
+            results = AllChem.MMFFOptimizeMoleculeConfs(mol, numThreads=num_threads, maxIters=200)
+        else:
+            results = AllChem.UFFOptimizeMoleculeConfs(mol, numThreads=num_threads, maxIters=200)
+        best = min(range(len(results)), key=lambda i: results[i][1])
+        conf_id = cids[best]
+    else:
+        conf_id = embed_fast(mol)                     # geometry, no minimization
+    sdf = Chem.MolToMolBlock(mol, confId=conf_id)     # SDF text block
 
     # --- 2D depiction ---
-    mol2d = Chem.RemoveHs(Chem.Mol(mol))              # cleaner 2D drawing
+    mol2d = mol_no_h                                  # cleaner 2D drawing, no copy/RemoveHs
     AllChem.Compute2DCoords(mol2d)
-    Draw.MolToFile(
-        mol2d, str(outdir / "structure.png"),
-        size=(800, 520),
-        kekulize=True
-    )
-    return sdf
+    return sdf, mol2d
+
+def draw_png(mol2d, path: Path):
+    """
+    Write the 2D structure image (kekulized) for a Mol with 2D coords.
+    Uses the Cairo drawer directly: PNG bytes come straight from the C++
+    renderer, without the PIL round-trip of Draw.MolToFile.
+    """
+    from rdkit.Chem.Draw import rdMolDraw2D
+
+    d2d = rdMolDraw2D.MolDraw2DCairo(800, 520)
+    rdMolDraw2D.PrepareAndDrawMolecule(d2d, mol2d, kekulize=True)
+    d2d.FinishDrawing()
+    path.write_bytes(d2d.GetDrawingText())
 
 def render_html(title, smiles, formula, mw, sdf, bullets, outdir: Path):
     """
@@ -167,11 +391,28 @@ def render_html(title, smiles, formula, mw, sdf, bullets, outdir: Path):
     - Embeds SDF into the page for 3Dmol.js
     - Shows 2D image, formula, MW, SMILES, and teaching bullets.
     """
-    html = Template(TPL_HTML.read_text()).render(
+    _get_html_tpl().stream(
         title=title, smiles=smiles, formula=formula, mw=mw,
         sdf=sdf, bullets=bullets
-    )
-    (outdir / "index.html").write_text(html)
+    ).dump(str(outdir / "index.html"), encoding="utf-8")
+
+# (substring of the IUPAC name, teaching bullet), checked in this order
+_NAME_BULLETS = (
+    ("meth",   "Parent chain includes: meth- (1 carbon)."),
+    ("eth",    "Parent chain includes: eth- (2 carbons)."),
+    ("prop",   "Parent chain includes: prop- (3 carbons)."),
+    ("but",    "Parent chain includes: but- (4 carbons)."),
+    ("pent",   "Parent chain includes: pent- (5 carbons)."),
+    ("hex",    "Parent chain includes: hex- (6 carbons)."),
+    ("hept",   "Parent chain includes: hept- (7 carbons)."),
+    ("oct",    "Parent chain includes: oct- (8 carbons)."),
+    ("non",    "Parent chain includes: non- (9 carbons)."),
+    ("dec",    "Parent chain includes: dec- (10 carbons)."),
+    ("en",     "Contains a C=C double bond (-en-)."),
+    ("yn",     "Contains a C≡C triple bond (-yn-)."),
+    ("methyl", "Has a methyl (-CH₃) substituent."),
+    ("bromo",  "Has a bromine substituent."),
+)
 
 def make_bullets_from_name(name: str):
     """
@@ -180,22 +421,7 @@ def make_bullets_from_name(name: str):
     """
     if not name:
         return []
-    b = []
-    if "meth" in name:  b.append("Parent chain includes: meth- (1 carbon).")
-    if "eth"  in name:  b.append("Parent chain includes: eth- (2 carbons).")
-    if "prop" in name:  b.append("Parent chain includes: prop- (3 carbons).")
-    if "but"  in name:  b.append("Parent chain includes: but- (4 carbons).")
-    if "pent" in name:  b.append("Parent chain includes: pent- (5 carbons).")
-    if "hex"  in name:  b.append("Parent chain includes: hex- (6 carbons).")
-    if "hept" in name:  b.append("Parent chain includes: hept- (7 carbons).")
-    if "oct"  in name:  b.append("Parent chain includes: oct- (8 carbons).")
-    if "non"  in name:  b.append("Parent chain includes: non- (9 carbons).")
-    if "dec"  in name:  b.append("Parent chain includes: dec- (10 carbons).")
-    if "en" in name:    b.append("Contains a C=C double bond (-en-).")
-    if "yn" in name:    b.append("Contains a C≡C triple bond (-yn-).")
-    if "methyl" in name: b.append("Has a methyl (-CH₃) substituent.")
-    if "bromo" in name:  b.append("Has a bromine substituent.")
-    return b
+    return [bullet for needle, bullet in _NAME_BULLETS if needle in name]
 
 def make_script(title, formula, mw, smiles, du):
     """
@@ -210,23 +436,22 @@ def make_script(title, formula, mw, smiles, du):
     ]
     voiceover = "\n".join(bullets)
 
-    # Build a minimal SRT timeline
-    srt_lines = []
-    t = 0
-    for i, line in enumerate(bullets, 1):
-        srt_lines.append(
-            f"{i}\n00:00:{t:02d},000 --> 00:00:{t+3:02d},000\n{line}\n"
-        )
-        t += 3
-    return voiceover, "\n".join(srt_lines)
+    # Build a minimal SRT timeline (cue i runs from 3*(i-1)s to 3*i s)
+    srt = "\n".join(
+        f"{i}\n00:00:{3*(i-1):02d},000 --> 00:00:{3*i:02d},000\n{line}\n"
+        for i, line in enumerate(bullets, 1)
+    )
+    return voiceover, srt
 
 
 def render_html(title, smiles, formula, mw, sdf, bullets, outdir: Path,
                 du=None, tutorial_id=None, subtitle=""):
     """
     Render the HTML tutorial page with optional tutorial metadata.
+    The page is streamed to disk chunk by chunk instead of being built as one
+    string first (the inlined SDF can be large).
     """
-    html = Template((TPL_HTML).read_text()).render(
+    _get_html_tpl().stream(
         title=title,
         subtitle=subtitle,
         tutorial_id=tutorial_id,
@@ -236,8 +461,124 @@ def render_html(title, smiles, formula, mw, sdf, bullets, outdir: Path,
         sdf=sdf,
         bullets=bullets,
         du=du
-    )
-    (outdir / "index.html").write_text(html)
+    ).dump(str(outdir / "index.html"), encoding="utf-8")
+
+def render_youtube_desc(title, smiles, formula, mw, outdir: Path):
+    """
+    Render YOUTUBE_DESCRIPTION.md from its template, streamed to disk.
+    """
+    _get_yt_tpl().stream(
+        title=title, smiles=smiles, formula=formula, mw=mw
+    ).dump(str(outdir / "YOUTUBE_DESCRIPTION.md"), encoding="utf-8")
+
+def build_tutorial(title, mol, mol_no_h, smiles, outdir: Path, name=None, subtitle="", hq=False,
+                   num_threads=0):
+    """
+    Build every artifact for one structure into outdir:
+    SDF, PNG, HTML page, voiceover, captions and YouTube description.
+    """
+    formula, mw, du = compute_facts(mol)
+    sdf, mol2d = make_artifacts(mol, mol_no_h, hq=hq, num_threads=num_threads)
+    bullets = make_bullets_from_name(name) if name else []
+    # include DBE/DU note at the end
+    bullets = (bullets or []) + [f"Double-bond equivalents (DU): {du:.1f}"]
+
+    voiceover, srt = make_script(title, formula, mw, smiles, du)
+
+    # The outputs are independent: overlap PNG encoding (releases the GIL)
+    # with the HTML render and the text writes.
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        jobs = [
+            pool.submit(draw_png, mol2d, outdir / "structure.png"),
+            pool.submit((outdir/"model.sdf").write_text, sdf),
+            pool.submit(render_html, title, smiles, formula, mw, sdf, bullets, outdir,
+                        subtitle=subtitle),
+            pool.submit((outdir/"voiceover.txt").write_text, voiceover),
+            pool.submit((outdir/"captions.srt").write_text, srt),
+            pool.submit(render_youtube_desc, title, smiles, formula, mw, outdir),
+        ]
+        for job in jobs:
+            job.result()                          # re-raise any write error
+
+def build_one(spec: dict) -> Path:
+    """
+    Build one tutorial from a plain dict, so it can be shipped to a worker process.
+    Keys: name / smiles / inchi (input), out, tutorial (subtitle), hq,
+    num_threads (RDKit threads for --hq; batch mode sets 1 per pool worker).
+    If both name and smiles are given (name already resolved), the SMILES is used
+    and the name only drives the title and teaching bullets.
+    Each worker process starts its own OPSIN worker on first name lookup.
+    Returns: output directory
+    """
+    name, smiles, inchi = spec.get("name"), spec.get("smiles"), spec.get("inchi")
+    title = name or smiles or inchi
+    outdir = ensure_out(_spec_outdir(spec))
+    mol, mol_no_h, smiles = mol_from_any(None if (smiles or inchi) else name, smiles, inchi)
+    build_tutorial(title, mol, mol_no_h, smiles, outdir,
+                   name=name, subtitle=spec.get("tutorial") or "", hq=spec.get("hq", False),
+                   num_threads=spec.get("num_threads", 0))
+    return outdir
+
+def _spec_outdir(spec: dict) -> Path:
+    """
+    Output directory build_one will use for a spec.
+    """
+    title = spec.get("name") or spec.get("smiles") or spec.get("inchi")
+    return Path(spec.get("out") or "out") / slugify(title)
+
+def _build_one_safe(spec: dict):
+    """
+    Pool wrapper around build_one: one bad input must not abort the batch.
+    Returns: (spec, error message or None)
+    """
+    try:
+        build_one(spec)
+        return spec, None
+    except Exception as e:
+        return spec, f"{type(e).__name__}: {e}"
+
+def dedupe_specs(specs: list[dict]) -> list[dict]:
+    """
+    Drop repeated inputs and reject distinct inputs that would share an
+    output directory (they would be built into it concurrently).
+    Raises: ValueError listing the colliding inputs
+    """
+    seen, unique, clashes = {}, [], []
+    for spec in specs:
+        outdir = _spec_outdir(spec)
+        key = (spec.get("name"), spec.get("smiles"), spec.get("inchi"))
+        if outdir not in seen:
+            seen[outdir] = key
+            unique.append(spec)
+        elif seen[outdir] != key:
+            clashes.append(f"  {outdir}: {seen[outdir]} vs {key}")
+    if clashes:
+        raise ValueError("Inputs map to the same output folder:\n" + "\n".join(clashes))
+    return unique
+
+def read_batch(path: Path) -> list[dict]:
+    """
+    Read a --batch file into build_one specs.
+    Example lines:
+      name: 4-bromo-3-methylhept-1-en-6-yne
+      smiles: CCC([Br]CC#C)=C
+      InChI=1S/...                  # bare InChI is detected
+      2-methylpropane               # bare line = IUPAC name
+    """
+    specs = []
+    for line in path.read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        kind, sep, value = line.partition(":")
+        kind = kind.strip().lower()
+        if sep and kind in ("name", "smiles", "inchi"):
+            specs.append({kind: value.strip()})
+        elif line.startswith("InChI="):
+            specs.append({"inchi": line})
+        else:
+            specs.append({"name": line})
+    return specs
 
 def main():
     ap = argparse.ArgumentParser(description="Auto-build chemistry tutorial")
@@ -246,10 +587,54 @@ def main():
     g.add_argument("--smiles")
     g.add_argument("--inchi")
     g.add_argument("--formula")
+    g.add_argument("--names-file", help="Text file with one IUPAC name per line (batch mode)")
+    g.add_argument("--batch", help="Text file with one input per line: 'name: ...', "
+                                   "'smiles: ...' or 'inchi: ...' (bare lines are names)")
     ap.add_argument("--tutorial", help="Optional subtitle/title for the tutorial (e.g., 'Tutorial 01 — Intro to Multiple Bonds')")
     ap.add_argument("--out", default="out")
+    ap.add_argument("--hq", action="store_true",
+                    help="Slower, higher-quality 3D: several conformers + force-field minimization")
     args = ap.parse_args()
 
+    common = {"out": args.out, "tutorial": args.tutorial, "hq": args.hq}
+
+    if args.names_file or args.batch:
+        # batch mode: one tutorial per input, built in parallel worker processes;
+        # the pool already uses every core, so RDKit runs single-threaded per worker
+        common["num_threads"] = 1
+        if args.names_file:
+            # resolve every name with one OPSIN run up front
+            names = [ln.strip() for ln in Path(args.names_file).read_text(encoding="utf-8").splitlines()
+                     if ln.strip()]
+            specs, failed = [], []
+            for n, smi in zip(names, names_to_smiles(names)):
+                if smi is None:
+                    failed.append(({"name": n}, f"OPSIN could not parse name: {n!r}"))
+                else:
+                    specs.append({"name": n, "smiles": smi, **common})
+            # a name listed twice is reported once
+            failed = list({spec["name"]: (spec, err) for spec, err in failed}.values())
+        else:
+            specs = [{**spec, **common} for spec in read_batch(Path(args.batch))]
+            failed = []
+        try:
+            specs = dedupe_specs(specs)
+        except ValueError as e:
+            sys.exit(f"❌ {e}")
+        total = len(specs) + len(failed)          # unresolved names count as failures
+        if specs:
+            with multiprocessing.Pool(min(os.cpu_count() or 1, len(specs))) as p:
+                results = p.map(_build_one_safe, specs)
+            failed += [(spec, err) for spec, err in results if err]
+
+        print(f"Built {total - len(failed)}/{total} tutorials under {args.out}/.")
+        for spec, err in failed:
+            src = next(f"{k}: {spec[k]}" for k in ("name", "smiles", "inchi") if spec.get(k))
+            print(f"❌ {src} -> {err}", file=sys.stderr)
+        if failed:
+            sys.exit(1)
+        return
+
     title = args.name or args.smiles or args.inchi or args.formula
     outdir = ensure_out(Path(args.out) / slugify(title))
 
@@ -279,24 +664,12 @@ def main():
         return
 
     # structure mode
-    mol, smiles = mol_from_any(args.name, args.smiles, args.inchi)
-    formula, mw, du = compute_facts(mol)
-    sdf = make_artifacts(mol, outdir)
-    bullets = make_bullets_from_name(args.name) if args.name else []
-    # include DBE/DU note at the end
-    bullets = (bullets or []) + [f"Double-bond equivalents (DU): {du:.1f}"]
-
-    render_html(title, smiles, formula, mw, sdf, bullets, outdir, subtitle=args.tutorial or "")
-
-    voiceover, srt = make_script(title, formula, mw, smiles, du)
-    (outdir/"voiceover.txt").write_text(voiceover)
-    (outdir/"captions.srt").write_text(srt)
-
-    yt = Template((TPL_YT).read_text()).render(
-        title=title, smiles=smiles, formula=formula, mw=mw
-    )
-    (outdir/"YOUTUBE_DESCRIPTION.md").write_text(yt)
+    outdir = build_one({"name": args.name, "smiles": args.smiles, "inchi": args.inchi, **common})
 
     print("✅ Done.")
     print(f"Open {outdir/'index.html'} (interactive 3D). See voiceover.txt and captions.srt.")
-    print(f"YouTube description ready at {outdir/'YOUTUBE_DESCRIPTION.md'}.")
\ No newline at end of file
+    print(f"YouTube description ready at {outdir/'YOUTUBE_DESCRIPTION.md'}.")
+
+if __name__ == "__main__":
+    main()
+